@@ -11,6 +11,9 @@ CLIENT_ID = os.getenv('SPOTIFY_CLIENT_ID')
 CLIENT_SECRET = os.getenv('SPOTIFY_CLIENT_SECRET')
 REDIRECT_URI = os.getenv('SPOTIFY_REDIRECT_URI', 'http://127.0.0.1:8888/callback')
 
+# Cache of saved episode URIs written by save_podcasts.py (SAVED_URIS_CACHE_FILE)
+SAVED_URIS_CACHE_FILE = 'saved_uris.pkl'
+
 def eliminar_todos_los_podcasts():
     # Validate credentials
     if not all([CLIENT_ID, CLIENT_SECRET]):
@@ -21,16 +24,28 @@ def eliminar_todos_los_podcasts():
                                                    client_secret=CLIENT_SECRET,
                                                    redirect_uri=REDIRECT_URI,
                                                    scope=scope))
-    # Fetch all saved episodes
+    # Fetch all saved episodes first, without modifying the library
+    episodes = []
     results = sp.current_user_saved_episodes(limit=50)
     while results['items']:
-        for item in results['items']:
-            episode_id = item['episode']['id']
-            sp.current_user_saved_episodes_delete([episode_id])
-            print(f"Deleted episode: {item['episode']['name']}")
+        episodes.extend(item['episode'] for item in results['items'])
+        if not results.get('next'):
+            break
+        results = sp.current_user_saved_episodes(limit=50, offset=len(episodes))
+
+    # Delete in batches of 50 IDs (API maximum per call)
+    for i in range(0, len(episodes), 50):
+        batch = episodes[i:i + 50]
+        sp.current_user_saved_episodes_delete([episode['id'] for episode in batch])
+        print(f"Deleted {len(batch)} episodes")
 
-        # Fetch the next batch of episodes
-        results = sp.current_user_saved_episodes(limit=50, offset=len(results['items']))
+    # The library is now empty, so the saved URIs cache is stale
+    try:
+        os.remove(SAVED_URIS_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"Could not remove {SAVED_URIS_CACHE_FILE}: {e}")
 
 if __name__ == "__main__":
     eliminar_todos_los_podcasts()
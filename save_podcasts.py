@@ -1,20 +1,30 @@
 import os
 import logging
+import pickle
+import random
+import threading
 import time
-from datetime import datetime
-from typing import List, Set, Dict, Tuple, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import List, Set, FrozenSet, Dict, Optional, Tuple
 from dataclasses import dataclass
-from functools import wraps
+from functools import cached_property, wraps
 
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 from spotipy.exceptions import SpotifyException
 from requests.exceptions import ReadTimeout, ConnectionError
+from dotenv import load_dotenv
+
+# Cargar variables de entorno
+load_dotenv()
 
 # Configuración de logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',  # sin milisegundos: evita el formateo extra por registro
     handlers=[
         logging.FileHandler('spotify_oldest_episodes.log'),
         logging.StreamHandler()
@@ -22,8 +32,80 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def retry_on_timeout(max_retries=3, delay=1, backoff=2):
-    """Decorador para reintentar operaciones que fallan por timeout."""
+# Errores de cliente que no se resuelven reintentando
+NON_RETRYABLE_STATUS = {400, 401, 403, 404}
+
+def _get_retry_after(error: Exception) -> Optional[int]:
+    """
+    Retorna los segundos de espera del header Retry-After si el error es un 429
+    que lo incluye. Sin header se usa el backoff exponencial normal.
+    """
+    if not isinstance(error, SpotifyException) or error.http_status != 429:
+        return None
+    retry_after = (error.headers or {}).get('Retry-After')
+    if retry_after is None:
+        return None
+    try:
+        return int(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+class CircuitOpenError(Exception):
+    """Se lanza cuando el circuit breaker está abierto y se omiten los requests."""
+
+# Circuit breaker compartido: se abre tras BREAKER_THRESHOLD fallos de servicio consecutivos
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60  # segundos
+_breaker = {'failures': 0, 'opened_at': None}
+_breaker_lock = threading.Lock()
+
+def _is_max_retries_error(error: Exception) -> bool:
+    """Indica si spotipy agotó sus reintentos internos (429/5xx); lo reporta como 429 con code -1."""
+    return isinstance(error, SpotifyException) and error.http_status == 429 and error.code == -1
+
+def _is_service_failure(error: Exception) -> bool:
+    """
+    Indica si el error apunta a que Spotify no está disponible: timeouts,
+    conexión, 5xx o reintentos internos de spotipy agotados.
+    """
+    if isinstance(error, SpotifyException):
+        if _is_max_retries_error(error):
+            return True
+        return error.http_status is not None and error.http_status >= 500
+    return True
+
+def _check_breaker() -> None:
+    """Lanza CircuitOpenError si el breaker está abierto y no ha pasado el cooldown."""
+    with _breaker_lock:
+        opened_at = _breaker['opened_at']
+        if opened_at is not None and time.time() - opened_at < BREAKER_COOLDOWN:
+            raise CircuitOpenError(
+                f"Spotify no disponible, requests suspendidos por {BREAKER_COOLDOWN}s"
+            )
+
+def _record_breaker_result(failed: bool) -> bool:
+    """Actualiza el breaker con el resultado de un intento. Retorna True si queda abierto."""
+    with _breaker_lock:
+        if not failed:
+            _breaker['failures'] = 0
+            _breaker['opened_at'] = None
+            return False
+        
+        _breaker['failures'] += 1
+        if _breaker['failures'] >= BREAKER_THRESHOLD:
+            if _breaker['opened_at'] is None:
+                logger.error(f"Circuit breaker abierto tras {_breaker['failures']} fallos consecutivos")
+            _breaker['opened_at'] = time.time()
+            return True
+        return False
+
+def retry_on_timeout(max_retries=3, delay=1, backoff=2, max_delay=30, record_breaker=False):
+    """Decorador para reintentar operaciones que fallan por timeout.
+    
+    Añade jitter aleatorio a la espera para evitar reintentos sincronizados
+    y deja de reintentar mientras el circuit breaker esté abierto. Solo los
+    requests HTTP reales (record_breaker=True) actualizan el estado del breaker.
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -31,16 +113,33 @@ def retry_on_timeout(max_retries=3, delay=1, backoff=2):
             current_delay = delay
             
             while retries < max_retries:
+                _check_breaker()
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
+                    if record_breaker:
+                        _record_breaker_result(failed=False)
+                    return result
                 except (ReadTimeout, ConnectionError, SpotifyException) as e:
+                    if isinstance(e, SpotifyException) and e.http_status in NON_RETRYABLE_STATUS:
+                        logger.error(f"Error no recuperable ({e.http_status}): {e}")
+                        raise
+                    
                     retries += 1
-                    if retries >= max_retries:
-                        logger.error(f"Falló después de {max_retries} intentos: {e}")
+                    breaker_open = record_breaker and _is_service_failure(e) and _record_breaker_result(failed=True)
+                    if retries >= max_retries or breaker_open:
+                        logger.error(f"Falló después de {retries} intentos: {e}")
                         raise
                     
-                    logger.warning(f"Intento {retries} falló, reintentando en {current_delay}s: {e}")
-                    time.sleep(current_delay)
+                    # En 429, respetar el tiempo indicado por Spotify
+                    retry_after = _get_retry_after(e)
+                    if retry_after is not None:
+                        logger.warning(f"Intento {retries}: rate limit, reintentando en {retry_after}s")
+                        time.sleep(retry_after)
+                        continue
+                    
+                    wait = min(max_delay, current_delay * (1 + random.uniform(0, 0.5)))
+                    logger.warning(f"Intento {retries} falló, reintentando en {wait:.1f}s: {e}")
+                    time.sleep(wait)
                     current_delay *= backoff
             
             return None
@@ -58,35 +157,36 @@ class EpisodeData:
     show_id: str
     show_name: str
     
-    def get_sort_key(self) -> Tuple[int, int, int]:
-        """Genera una clave de ordenamiento basada en la fecha de lanzamiento (más viejo = menor valor)."""
+    @cached_property
+    def sort_key(self) -> date:
+        """Clave de ordenamiento basada en la fecha de lanzamiento (más viejo = menor valor), calculada una sola vez."""
         try:
-            date_parts = list(map(int, self.release_date.split('-')))
-            
             if self.release_date_precision == 'year':
-                return (date_parts[0], 1, 1)  # 1 de enero del año
+                return date.fromisoformat(self.release_date + '-01-01')  # 1 de enero del año
             elif self.release_date_precision == 'month':
-                return (date_parts[0], date_parts[1], 1)  # día 1 del mes
+                return date.fromisoformat(self.release_date + '-01')  # día 1 del mes
             
-            return tuple(date_parts)
-        except (ValueError, IndexError):
+            return date.fromisoformat(self.release_date)
+        except (ValueError, TypeError):
             # Fecha inválida, colocar al final (más nuevo)
-            return (9999, 12, 31)
+            return date.max
     
     def get_readable_date(self) -> str:
         """Retorna la fecha en formato legible."""
-        try:
-            sort_key = self.get_sort_key()
-            return f"{sort_key[0]:04d}-{sort_key[1]:02d}-{sort_key[2]:02d}"
-        except:
+        if self.sort_key == date.max:
             return self.release_date
+        return self.sort_key.isoformat()
 
 class SpotifyOldestEpisodeManager:
     """Gestor que guarda únicamente el episodio MÁS VIEJO no finalizado de cada podcast."""
     
     DEFAULT_LIMIT = 50
     REQUEST_TIMEOUT = 30
-    DELAY_BETWEEN_REQUESTS = 0.2
+    MAX_REQUESTS_PER_SECOND = 10
+    MAX_WORKERS = 4
+    MAX_IDS_PER_REQUEST = 50
+    SAVED_URIS_CACHE_FILE = 'saved_uris.pkl'
+    SAVED_URIS_CACHE_TTL = 3600  # segundos
     
     # Scopes necesarios
     REQUIRED_SCOPES = [
@@ -97,12 +197,19 @@ class SpotifyOldestEpisodeManager:
     
     def __init__(self):
         """Inicializa el gestor de podcasts."""
-        self.client_id = os.getenv('SPOTIFY_CLIENT_ID', 'c798243109ac4543be01179d648837d9')
-        self.client_secret = os.getenv('SPOTIFY_CLIENT_SECRET', '4ec223e6d89d43f5b87c1d6aa1b2a8c7')
+        self.client_id = os.getenv('SPOTIFY_CLIENT_ID')
+        self.client_secret = os.getenv('SPOTIFY_CLIENT_SECRET')
         self.redirect_uri = os.getenv('SPOTIFY_REDIRECT_URI', 'http://127.0.0.1:8888/callback')
         
+        if not all([self.client_id, self.client_secret]):
+            raise ValueError("Faltan credenciales de Spotify. Asegúrate de configurar SPOTIFY_CLIENT_ID y SPOTIFY_CLIENT_SECRET en tu archivo .env")
+        
         self.sp = self._authenticate()
         self.request_count = 0
+        self._request_times = deque()
+        self._rate_limit_lock = threading.Lock()
+        self._saved_uris: FrozenSet[str] = frozenset()
+        self._saved_uris_cached_at: Optional[float] = None
         
     def _authenticate(self) -> spotipy.Spotify:
         """Autentica con la API de Spotify."""
@@ -120,43 +227,105 @@ class SpotifyOldestEpisodeManager:
             raise
     
     def _rate_limit_control(self):
-        """Controla la velocidad de requests para evitar rate limiting."""
-        self.request_count += 1
-        time.sleep(self.DELAY_BETWEEN_REQUESTS)
-        if self.request_count % 10 == 0:
-            time.sleep(1)
+        """Controla la velocidad de requests para evitar rate limiting.
+        
+        Mantiene una ventana deslizante de 1s y solo espera cuando se alcanza
+        MAX_REQUESTS_PER_SECOND dentro de esa ventana.
+        """
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            while self._request_times and now - self._request_times[0] >= 1:
+                self._request_times.popleft()
+            
+            if len(self._request_times) >= self.MAX_REQUESTS_PER_SECOND:
+                time.sleep(1 - (now - self._request_times[0]))
+                self._request_times.popleft()
+            
+            self._request_times.append(time.monotonic())
+            self.request_count += 1
     
-    @retry_on_timeout(max_retries=3, delay=2, backoff=2)
+    @retry_on_timeout(max_retries=3, delay=2, backoff=2, record_breaker=True)
     def _safe_request(self, request_func, *args, **kwargs):
         """Ejecuta un request de forma segura con control de rate limiting."""
         self._rate_limit_control()
         return request_func(*args, **kwargs)
     
     def _paginate_request(self, initial_request, next_func=None):
-        """Maneja la paginación de requests de Spotify."""
+        """Maneja la paginación de requests de Spotify.
+        
+        La siguiente página se solicita en segundo plano mientras se entregan
+        los items de la página actual, por lo que no debe modificarse la
+        biblioteca mientras se itera.
+        """
         if next_func is None:
             next_func = self.sp.next
             
         current = initial_request
         
-        while current and current.get('items'):
-            yield from current['items']
-            
-            if current.get('next'):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while current and current.get('items'):
+                next_page = None
+                if current.get('next'):
+                    next_page = executor.submit(self._safe_request, next_func, current)
+                
+                yield from current['items']
+                
+                if next_page is None:
+                    break
+                
                 try:
-                    current = self._safe_request(next_func, current)
+                    current = next_page.result()
                     if current is None:
                         break
                 except Exception as e:
                     logger.error(f"Error en paginación: {e}")
                     break
-            else:
-                break
+    
+    def _load_saved_uris_cache(self) -> Optional[Tuple[float, Set[str]]]:
+        """Carga (fecha del barrido completo, URIs) desde el caché en disco si no ha expirado."""
+        try:
+            with open(self.SAVED_URIS_CACHE_FILE, 'rb') as f:
+                cached_at, uris = pickle.load(f)
+            
+            if time.time() - cached_at > self.SAVED_URIS_CACHE_TTL:
+                return None
+            return cached_at, set(uris)
+        except (OSError, pickle.PickleError, EOFError, ValueError, TypeError):
+            return None
+    
+    def _store_saved_uris_cache(self, uris: Set[str], cached_at: float) -> None:
+        """
+        Guarda los URIs en el caché en disco.
+        
+        `cached_at` es la fecha del último barrido completo; al combinar datos
+        parciales se conserva para que el TTL no se reinicie.
+        """
+        try:
+            with open(self.SAVED_URIS_CACHE_FILE, 'wb') as f:
+                pickle.dump((cached_at, set(uris)), f)
+        except OSError as e:
+            logger.warning(f"No se pudo escribir el caché de episodios guardados: {e}")
+    
+    def _invalidate_saved_uris_cache(self) -> None:
+        """Elimina el caché en disco de episodios guardados."""
+        try:
+            os.remove(self.SAVED_URIS_CACHE_FILE)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"No se pudo eliminar el caché de episodios guardados: {e}")
     
     @retry_on_timeout(max_retries=2, delay=1)
-    def get_already_saved_episode_uris(self) -> Set[str]:
-        """Obtiene los URIs de episodios ya guardados en 'Mis Podcasts'."""
-        uris = set()
+    def get_already_saved_episode_uris(self) -> FrozenSet[str]:
+        """
+        Obtiene los URIs de episodios ya guardados en 'Mis Podcasts'.
+        
+        Si hay un caché reciente en disco solo se consulta la primera página
+        (los guardados más recientes) y se combina con el caché, conservando
+        la fecha del último barrido completo.
+        """
+        cache = self._load_saved_uris_cache()
+        cached_at, uris = cache if cache is not None else (None, set())
         
         try:
             saved_episodes = self._safe_request(
@@ -165,22 +334,43 @@ class SpotifyOldestEpisodeManager:
             )
             
             if saved_episodes:
-                for item in self._paginate_request(saved_episodes):
+                if cache is not None:
+                    items = saved_episodes.get('items', [])
+                else:
+                    sweep_started_at = time.time()
+                    items = self._paginate_request(saved_episodes)
+                
+                item_count = 0
+                for item in items:
+                    item_count += 1
                     if item and 'episode' in item and 'uri' in item['episode']:
                         uris.add(item['episode']['uri'])
+                
+                # _paginate_request corta en silencio ante errores: solo un barrido completo renueva el caché
+                if cache is None:
+                    if item_count >= saved_episodes.get('total', 0):
+                        cached_at = sweep_started_at
+                    else:
+                        logger.warning(f"Barrido incompleto ({item_count}/{saved_episodes.get('total')}), no se actualiza el caché")
+            
+            if cached_at is not None:
+                self._saved_uris_cached_at = cached_at
+                self._store_saved_uris_cache(uris, cached_at)
                         
         except Exception as e:
             logger.error(f"Error al obtener episodios guardados: {e}")
         
         logger.info(f"Episodios ya guardados en 'Mis Podcasts': {len(uris)}")
-        return uris
+        return frozenset(uris)
     
     def find_oldest_unfinished_episode_per_podcast(self) -> List[EpisodeData]:
         """
         Encuentra el episodio MÁS VIEJO no finalizado de cada podcast seguido.
         """
         oldest_episodes = []
-        already_saved_uris = self.get_already_saved_episode_uris()
+        # Snapshot que reutiliza save_oldest_episodes_to_library para no volver a
+        # consultar la biblioteca; solo es válido después de este método
+        self._saved_uris = self.get_already_saved_episode_uris()
         
         try:
             # Obtener todos los podcasts seguidos
@@ -193,33 +383,36 @@ class SpotifyOldestEpisodeManager:
                 logger.warning("No se pudieron obtener los shows guardados")
                 return []
             
-            show_count = 0
-            for show in self._paginate_request(shows):
-                if not show or 'show' not in show:
-                    continue
-                    
-                show_count += 1
-                show_id = show['show']['id']
-                show_name = show['show'].get('name', 'Desconocido')
-                
-                logger.info(f"Procesando podcast {show_count}: {show_name}")
-                
-                try:
-                    oldest_episode = self._find_oldest_unfinished_episode_in_show(
-                        show_id, show_name, already_saved_uris
+            # Recopilar todos los podcasts antes de procesarlos en paralelo
+            show_list = [
+                (show['show']['id'], show['show'].get('name', 'Desconocido'))
+                for show in self._paginate_request(shows)
+                if show and 'show' in show
+            ]
+            show_count = len(show_list)
+            
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(
+                        self._find_oldest_unfinished_episode_in_show,
+                        show_id, show_name
                     )
-                    
-                    if oldest_episode:
-                        oldest_episodes.append(oldest_episode)
-                        logger.info(f"  ✓ Episodio más viejo encontrado: {oldest_episode.get_readable_date()} - {oldest_episode.episode_name[:60]}...")
-                    else:
-                        logger.info(f"  ✗ No se encontraron episodios válidos")
-                        
-                except Exception as e:
-                    logger.error(f"Error procesando podcast {show_name}: {e}")
-                    continue
+                    for show_id, show_name in show_list
+                ]
                 
-                time.sleep(0.3)  # Pausa entre podcasts
+                for i, ((show_id, show_name), future) in enumerate(zip(show_list, futures), 1):
+                    try:
+                        oldest_episode = future.result()
+                        
+                        if oldest_episode:
+                            oldest_episodes.append(oldest_episode)
+                            logger.info(f"  ✓ {i:2d}/{show_count} {show_name}: {oldest_episode.get_readable_date()} - {oldest_episode.episode_name[:60]}...")
+                        else:
+                            logger.debug(f"  ✗ {i:2d}/{show_count} {show_name}: no se encontraron episodios válidos")
+                            
+                    except Exception as e:
+                        logger.error(f"Error procesando podcast {show_name}: {e}")
+                        continue
                 
         except Exception as e:
             logger.error(f"Error al obtener shows guardados: {e}")
@@ -231,57 +424,77 @@ class SpotifyOldestEpisodeManager:
         
         return oldest_episodes
     
-    def _find_oldest_unfinished_episode_in_show(self, show_id: str, show_name: str, already_saved_uris: Set[str]) -> Optional[EpisodeData]:
+    def _find_oldest_unfinished_episode_in_show(self, show_id: str, show_name: str) -> Optional[EpisodeData]:
         """
         Encuentra el episodio MÁS VIEJO no finalizado en un podcast específico.
+        
+        Spotify devuelve los episodios del más nuevo al más viejo, así que se
+        empieza por la última página y se retrocede solo si en ella no hay
+        ningún episodio válido.
         """
         try:
-            # Obtener todos los episodios del podcast
-            show_episodes = self._safe_request(
+            # La primera página indica el total de episodios del podcast
+            first_page = self._safe_request(
                 self.sp.show_episodes, 
                 show_id, 
                 limit=self.DEFAULT_LIMIT
             )
             
-            if not show_episodes:
+            if not first_page:
                 return None
             
-            valid_episodes = []
+            offset = max(0, first_page.get('total', 0) - self.DEFAULT_LIMIT)
+            is_valid = self._is_episode_valid_for_saving
             
-            # Recopilar todos los episodios válidos (no finalizados, no guardados)
-            for episode in self._paginate_request(show_episodes):
-                if not self._is_episode_valid_for_saving(episode, already_saved_uris):
-                    continue
+            while True:
+                if offset == 0:
+                    page = first_page
+                else:
+                    page = self._safe_request(
+                        self.sp.show_episodes, 
+                        show_id, 
+                        limit=self.DEFAULT_LIMIT,
+                        offset=offset
+                    )
                 
-                episode_data = EpisodeData(
-                    uri=episode['uri'],
-                    release_date=episode['release_date'],
-                    release_date_precision=episode.get('release_date_precision', 'day'),
-                    episode_id=episode['id'],
-                    episode_name=episode.get('name', 'Sin título'),
-                    show_id=show_id,
-                    show_name=show_name
-                )
+                oldest_episode = None
+                oldest_key = None
                 
-                valid_episodes.append(episode_data)
-            
-            if not valid_episodes:
-                return None
-            
-            # Ordenar por fecha (más viejo primero) y tomar el primero
-            valid_episodes.sort(key=lambda ep: ep.get_sort_key())
-            oldest_episode = valid_episodes[0]
-            
-            logger.debug(f"    Episodios válidos encontrados: {len(valid_episodes)}")
-            logger.debug(f"    Más viejo: {oldest_episode.get_readable_date()}")
-            
-            return oldest_episode
+                # Recorrer la página desde el final (más viejo) quedándose con el válido más viejo
+                for episode in reversed((page or {}).get('items') or []):
+                    if not is_valid(episode):
+                        continue
+                    
+                    episode_data = EpisodeData(
+                        uri=episode['uri'],
+                        release_date=episode['release_date'],
+                        release_date_precision=episode.get('release_date_precision', 'day'),
+                        episode_id=episode['id'],
+                        episode_name=episode.get('name', 'Sin título'),
+                        show_id=show_id,
+                        show_name=show_name
+                    )
+                    
+                    sort_key = episode_data.sort_key
+                    if oldest_key is None or sort_key < oldest_key:
+                        oldest_episode, oldest_key = episode_data, sort_key
+                
+                if oldest_episode is not None:
+                    logger.debug(f"    Encontrado en offset {offset}")
+                    logger.debug(f"    Más viejo: {oldest_episode.get_readable_date()}")
+                    return oldest_episode
+                
+                if offset == 0:
+                    return None
+                
+                # Ningún episodio válido en esta página: retroceder a episodios más nuevos
+                offset = max(0, offset - self.DEFAULT_LIMIT)
             
         except Exception as e:
             logger.error(f"Error al procesar episodios del show {show_id}: {e}")
             return None
     
-    def _is_episode_valid_for_saving(self, episode: Dict, already_saved_uris: Set[str]) -> bool:
+    def _is_episode_valid_for_saving(self, episode: Dict) -> bool:
         """
         Verifica si un episodio es válido para guardar:
         - Tiene datos básicos necesarios
@@ -291,16 +504,13 @@ class SpotifyOldestEpisodeManager:
         if not (episode and 'uri' in episode and 'release_date' in episode and 'id' in episode):
             return False
         
-        # No guardar si está completamente reproducido
-        resume_point = episode.get('resume_point', {})
-        if resume_point.get('fully_played', False):
-            return False
-        
         # No guardar si es contenido exclusivo
-        if episode.get('is_paywall_content', False):
+        if episode.get('is_paywall_content'):
             return False
         
-        return True
+        # No guardar si está completamente reproducido (sin resume_point no hay progreso)
+        resume_point = episode.get('resume_point')
+        return not (resume_point and resume_point.get('fully_played'))
     
     @retry_on_timeout(max_retries=3, delay=1)
     def save_oldest_episodes_to_library(self) -> None:
@@ -320,47 +530,58 @@ class SpotifyOldestEpisodeManager:
             logger.info("No se encontraron episodios para guardar.")
             return
         
-        # Obtener los URIs de episodios ya guardados
-        already_saved_uris = self.get_already_saved_episode_uris()
+        # URIs de episodios ya guardados (snapshot tomado al buscar los episodios)
+        already_saved_uris = self._saved_uris
         
         logger.info(f"\n=== GUARDANDO {len(oldest_episodes)} EPISODIOS ===")
         
         # Mostrar lista de episodios que se van a guardar
-        logger.info("Episodios que se guardarán:")
+        logger.debug("Episodios que se guardarán:")
         for i, episode in enumerate(oldest_episodes, 1):
-            logger.info(f"  {i:2d}. {episode.get_readable_date()} - {episode.show_name}")
-            logger.info(f"      {episode.episode_name}")
+            logger.debug(f"  {i:2d}. {episode.get_readable_date()} - {episode.show_name}")
+            logger.debug(f"      {episode.episode_name}")
         
         logger.info("\nIniciando guardado...")
         
-        # Guardar cada episodio
+        # Separar los episodios que ya están en 'Mis Podcasts'
+        total = len(oldest_episodes)
         success_count = 0
         skip_count = 0
+        newly_saved_uris = set()
+        pending = []
         for i, episode in enumerate(oldest_episodes, 1):
+            if episode.uri in already_saved_uris:
+                logger.debug(f"  ⚠ {i:2d}/{total} - Ya guardado: {episode.show_name}")
+                skip_count += 1
+            else:
+                pending.append((i, episode))
+        
+        # Guardar en lotes (la API acepta hasta MAX_IDS_PER_REQUEST episodios por llamada)
+        for start in range(0, len(pending), self.MAX_IDS_PER_REQUEST):
+            batch = pending[start:start + self.MAX_IDS_PER_REQUEST]
             try:
-                # No guardar si ya está en 'Mis Podcasts'
-                if episode.uri in already_saved_uris:
-                    logger.info(f"  ⚠ {i:2d}/{len(oldest_episodes)} - Ya guardado: {episode.show_name}")
-                    skip_count += 1
-                    continue
-                    
                 self._safe_request(
                     self.sp.current_user_saved_episodes_add, 
-                    [episode.uri]
+                    [episode.uri for _, episode in batch]
                 )
-                success_count += 1
-                logger.info(f"  ✓ {i:2d}/{len(oldest_episodes)} - Guardado: {episode.show_name}")
-                
-                time.sleep(0.5)  # Pausa entre guardados
-                
             except Exception as e:
-                logger.error(f"  ✗ {i:2d}/{len(oldest_episodes)} - Error guardando {episode.show_name}: {e}")
+                logger.error(f"  ✗ Error guardando lote de {len(batch)} episodios: {e}")
+                for i, episode in batch:
+                    logger.debug(f"  ✗ {i:2d}/{total} - No guardado: {episode.show_name}")
+                continue
+            
+            for i, episode in batch:
+                success_count += 1
+                newly_saved_uris.add(episode.uri)
+                logger.debug(f"  ✓ {i:2d}/{total} - Guardado: {episode.show_name}")
+            logger.info(f"  ✓ Guardados {len(batch)} episodios")
         
         logger.info(f"\n=== PROCESO COMPLETADO ===")
         logger.info(f"Episodios guardados exitosamente: {success_count}/{len(oldest_episodes)}")
         logger.info(f"Episodios ya guardados (omitidos): {skip_count}/{len(oldest_episodes)}")
         
-        if success_count > 0:
+        if success_count > 0 and self._saved_uris_cached_at is not None:
+            self._store_saved_uris_cache(already_saved_uris | newly_saved_uris, self._saved_uris_cached_at)
             logger.info("Los episodios más viejos han sido guardados en 'Mis Podcasts'")
         
     def clean_finished_episodes(self) -> None:
@@ -379,33 +600,45 @@ class SpotifyOldestEpisodeManager:
             
             removed_count = 0
             processed_count = 0
+            finished = []
             
+            # Recopilar primero los finalizados: borrar durante la paginación desplaza las páginas
             for item in self._paginate_request(saved_episodes):
                 if not item or 'episode' not in item:
                     continue
                 
                 processed_count += 1
                 episode = item['episode']
-                episode_uri = episode['uri']
-                episode_name = episode.get('name', 'Sin título')
                 
                 # Verificar si está completamente reproducido
-                resume_point = episode.get('resume_point', {})
+                resume_point = episode.get('resume_point') or {}
                 if resume_point.get('fully_played', False):
-                    try:
-                        self._safe_request(
-                            self.sp.current_user_saved_episodes_delete, 
-                            [episode_uri]
-                        )
-                        removed_count += 1
-                        logger.info(f"Eliminado (finalizado): {episode_name}")
-                        time.sleep(0.3)
-                    except Exception as e:
-                        logger.error(f"Error al eliminar {episode_name}: {e}")
+                    finished.append((episode['uri'], episode.get('name', 'Sin título')))
                 
                 if processed_count % 20 == 0:
                     logger.info(f"Procesados {processed_count} episodios...")
-                    time.sleep(1)
+            
+            # Eliminar en lotes (la API acepta hasta MAX_IDS_PER_REQUEST episodios por llamada)
+            for start in range(0, len(finished), self.MAX_IDS_PER_REQUEST):
+                batch = finished[start:start + self.MAX_IDS_PER_REQUEST]
+                try:
+                    self._safe_request(
+                        self.sp.current_user_saved_episodes_delete, 
+                        [episode_uri for episode_uri, _ in batch]
+                    )
+                except Exception as e:
+                    logger.error(f"Error al eliminar lote de {len(batch)} episodios: {e}")
+                    for _, episode_name in batch:
+                        logger.debug(f"No eliminado: {episode_name}")
+                    continue
+                
+                for _, episode_name in batch:
+                    removed_count += 1
+                    logger.debug(f"Eliminado (finalizado): {episode_name}")
+                logger.info(f"Eliminados {len(batch)} episodios finalizados")
+            
+            if removed_count > 0:
+                self._invalidate_saved_uris_cache()
             
             logger.info(f"=== LIMPIEZA COMPLETADA ===")
             logger.info(f"Episodios eliminados: {removed_count}")